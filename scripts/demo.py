@@ -14,29 +14,27 @@ Usage:
     uv run python scripts/demo.py [--task "your task here"] [--headless]
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
 import shutil
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from agents import RunConfig, Runner
-from agents.exceptions import MaxTurnsExceeded
-from playwright.async_api import async_playwright
-
-from browser_agent.agents import create_navigator_agent, create_planner_agent
-from browser_agent.core import (
-    ElementRegistry,
-    launch_persistent_context_async,
-    setup_openrouter_for_sdk,
-)
-from browser_agent.core.logging import ErrorIds, logError, logEvent
-from browser_agent.tools import create_browser_tools
 from rich.console import Console
-from rich.panel import Panel
+
+from browser_agent.runtime import run, wait_for_shutdown
+
+if TYPE_CHECKING:
+    from agents import RunResultStreaming
+
+# Heavy imports (agents SDK, Playwright, browser_agent) are deferred to the
+# functions that use them so --help and argument errors return immediately.
 
 console = Console()
 
@@ -44,6 +42,25 @@ DEFAULT_DEMO_TASK = "Go to example.com and tell me what the page title is"
 DEMO_SESSION_DIR = Path.home() / ".browser-agent" / "demo-session"
 
 
+async def _stream_events(result: RunResultStreaming) -> None:
+    """Print agent text deltas, tool calls, and handoffs as they arrive.
+
+    Args:
+        result: The streaming run result from Runner.run_streamed().
+    """
+    from openai.types.responses import ResponseTextDeltaEvent
+
+    async for event in result.stream_events():
+        if event.type == "raw_response_event":
+            if isinstance(event.data, ResponseTextDeltaEvent):
+                console.print(event.data.delta, end="", markup=False, highlight=False)
+        elif event.type == "agent_updated_stream_event":
+            console.print(f"\n[bold cyan]→ {event.new_agent.name}[/bold cyan]")
+        elif event.type == "run_item_stream_event" and event.name == "tool_called":
+            tool_name = getattr(event.item.raw_item, "name", "tool")
+            console.print(f"\n[dim]  ↳ {tool_name}[/dim]")
+
+
 async def run_demo(
     task: str,
     headless: bool = False,
@@ -58,11 +75,34 @@ async def run_demo(
         auto_approve: Whether to auto-approve all actions.
         clean_cache: Whether to clear the session cache before starting.
     """
+    from agents import RunConfig, Runner
+    from agents.exceptions import MaxTurnsExceeded
+    from playwright.async_api import async_playwright
+    from rich.panel import Panel
+
+    from browser_agent.agents import create_navigator_agent, create_planner_agent
+    from browser_agent.core import (
+        ElementRegistry,
+        close_openrouter_for_sdk,
+        discard_session_dir,
+        launch_persistent_context_async,
+        setup_openrouter_for_sdk,
+    )
+    from browser_agent.core.logging import ErrorIds, logError, logEvent
+    from browser_agent.tools import create_browser_tools
+
     session_dir = DEMO_SESSION_DIR
 
+    # Move the old session aside and delete it in the background instead of
+    # blocking startup on rmtree
+    cleanup: asyncio.Task[None] | None = None
     if clean_cache and session_dir.exists():
         console.print(f"[yellow]Cleaning demo session cache: {session_dir}[/yellow]")
-        shutil.rmtree(session_dir)
+        old_session = discard_session_dir(session_dir)
+        if old_session is not None:
+            cleanup = asyncio.create_task(
+                asyncio.to_thread(shutil.rmtree, old_session, ignore_errors=True)
+            )
     session_dir.mkdir(parents=True, exist_ok=True)
 
     console.print(f"\n[bold green]Task:[/bold green] {task}")
@@ -114,7 +154,8 @@ async def run_demo(
         console.print("\n[yellow]Starting agent...[/yellow]")
         try:
             run_config = RunConfig(model_provider=model_provider)
-            result = await Runner.run(planner, task, max_turns=30, run_config=run_config)
+            result = Runner.run_streamed(planner, task, max_turns=30, run_config=run_config)
+            await _stream_events(result)
             logEvent("demo_complete", {"task": task, "output": str(result.final_output)[:200]})
             console.print("\n")
             console.print(Panel(
@@ -136,11 +177,8 @@ async def run_demo(
         # Keep browser open for observation
         if not headless:
             console.print("\n[dim]Press Ctrl+C to close the browser...[/dim]")
-            try:
-                while True:
-                    await asyncio.sleep(1)
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Shutting down...[/yellow]")
+            await wait_for_shutdown(context)
+            console.print("\n[yellow]Shutting down...[/yellow]")
 
     except Exception as e:
         logError(ErrorIds.UNEXPECTED_ERROR, f"Demo script error: {e}", exc_info=True)
@@ -151,6 +189,9 @@ async def run_demo(
         if context is not None:
             await context.close()
         await pw.stop()
+        await close_openrouter_for_sdk()
+        if cleanup is not None:
+            await cleanup
 
 
 async def main() -> None:
@@ -182,6 +223,8 @@ async def main() -> None:
 
     args = parser.parse_args()
 
+    from rich.panel import Panel
+
     # Display demo banner
     console.print(Panel.fit(
         "[bold cyan]Browser Agent Demo[/bold cyan]\n"
@@ -211,4 +254,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -6,40 +6,64 @@ and collects success/failure metrics.
 
 Usage:
     uv run python scripts/eval.py [--headless] [--visible] [--tasks N]
+                                  [--concurrency N] [--batch-plans]
+                                  [--task-timeout SECONDS]
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import hashlib
+import json
 import shutil
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from agents import RunConfig, Runner
-from agents.exceptions import MaxTurnsExceeded
-from playwright.async_api import async_playwright
-
-from browser_agent.agents import create_navigator_agent, create_planner_agent
-from browser_agent.core import (
-    ElementRegistry,
-    launch_persistent_context_async,
-    setup_openrouter_for_sdk,
-)
-from browser_agent.core.logging import ErrorIds, logError, logEvent
-from browser_agent.tools import create_browser_tools
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, RenderableType
+
+from browser_agent.runtime import run
+
+if TYPE_CHECKING:
+    from agents import Agent
+    from agents.models.interface import ModelProvider
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
+    from browser_agent.core import ElementRegistry
+
+# Heavy imports (agents SDK, Playwright, browser_agent) are deferred to the
+# functions that use them so --help and argument errors return immediately.
 
 console = Console()
 
 EVAL_SESSION_DIR = Path.home() / ".browser-agent" / "eval-session"
 
+# Per-task results are appended here (one JSON Lines file per run) as each
+# task finishes; kept outside EVAL_SESSION_DIR, which every run discards
+EVAL_RESULTS_DIR = Path.home() / ".browser-agent" / "eval-results"
+
+# Batch-planner output cached across runs, keyed by task/model/instructions hash
+PLAN_CACHE_PATH = Path.home() / ".browser-agent" / "plan-cache.json"
+
+# Bump when the cached plan format or how plans are used changes; old
+# entries then stop matching and age out
+PLAN_CACHE_VERSION = 1
+
+# Oldest cached plans are dropped beyond this many entries
+PLAN_CACHE_MAX_ENTRIES = 256
+
+# Upper bound on tasks running at once (keeps OpenRouter rate limits in check)
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Wall-clock limit per task in seconds (guards against hung page loads)
+DEFAULT_TASK_TIMEOUT = 120.0
+
 
 @dataclass
 class TaskResult:
@@ -69,6 +93,17 @@ class EvaluationMetrics:
     total_user_inputs: int = 0
     total_duration: float = 0.0
 
+    def add_result(self, result: TaskResult) -> None:
+        """Fold a single task result into the running totals."""
+        self.total_tasks += 1
+        self.successful_tasks += result.success
+        self.failed_tasks += not result.success
+        self.total_steps += result.steps_executed
+        self.total_successful_steps += result.steps_succeeded
+        self.total_failed_steps += result.steps_failed
+        self.total_user_inputs += result.user_inputs_required
+        self.total_duration += result.duration_seconds
+
     def get_success_rate(self) -> float:
         """Calculate success rate as percentage."""
         if self.total_tasks == 0:
@@ -82,31 +117,41 @@ class EvaluationMetrics:
         return self.total_steps / self.total_tasks
 
 
+@dataclass(frozen=True, slots=True)
+class TestTask:
+    """A predefined evaluation task."""
+
+    name: str
+    description: str
+    expected_steps: int
+    requires_user_input: bool = False
+
+
 # Predefined test tasks for evaluation
-TEST_TASKS: list[dict[str, Any]] = [
-    {
-        "name": "Simple Navigation",
-        "description": "Navigate to https://example.com",
-        "expected_steps": 1,
-        "requires_user_input": False,
-    },
-    {
-        "name": "Search Query",
-        "description": "Go to Google and search for 'python tutorial'",
-        "expected_steps": 3,
-        "requires_user_input": False,
-    },
-    {
-        "name": "Form Fill",
-        "description": "Navigate to a form and fill in sample data",
-        "expected_steps": 2,
-        "requires_user_input": False,
-    },
+TEST_TASKS: list[TestTask] = [
+    TestTask(
+        name="Simple Navigation",
+        description="Navigate to https://example.com",
+        expected_steps=1,
+    ),
+    TestTask(
+        name="Search Query",
+        description="Go to Google and search for 'python tutorial'",
+        expected_steps=3,
+    ),
+    TestTask(
+        name="Form Fill",
+        description="Navigate to a form and fill in sample data",
+        expected_steps=2,
+    ),
 ]
 
 
 def display_metrics(metrics: EvaluationMetrics) -> None:
     """Display evaluation metrics in a formatted table."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     console.print("\n")
     console.print(Panel.fit(
         "[bold cyan]Evaluation Report[/bold cyan]",
@@ -129,124 +174,503 @@ def display_metrics(metrics: EvaluationMetrics) -> None:
     console.print(table)
 
 
-async def run_evaluation(
-    headless: bool = True,
-    max_tasks: int | None = None,
-) -> None:
-    """Run evaluation tasks through the agent pipeline.
+@dataclass
+class EvalSlot:
+    """A pooled browser context with its page, registry and agents pre-built.
+
+    Tools are bound to the slot's page and registry, so the Navigator and
+    Planner are built once per slot and reused by every task it runs.
+    """
+
+    context: BrowserContext
+    page: Page
+    registry: ElementRegistry
+    navigator: Agent
+    planner: Agent
+
+
+def _results_path() -> Path:
+    """Create EVAL_RESULTS_DIR and return a new timestamped results file path."""
+    EVAL_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return EVAL_RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+
+
+async def _console_writer(output: asyncio.Queue[RenderableType]) -> None:
+    """Print queued output one item at a time.
+
+    Concurrent tasks enqueue their output instead of printing directly, so
+    each task's lines come out whole rather than interleaved mid-render.
 
     Args:
-        headless: Whether to run in headless mode.
-        max_tasks: Maximum number of tasks to run (None = all).
+        output: Queue of Rich renderables (markup strings, panels, tables).
     """
-    tasks = TEST_TASKS[:max_tasks] if max_tasks else TEST_TASKS
-    results: list[TaskResult] = []
+    from browser_agent.core.logging import ErrorIds, logError
+
+    while True:
+        item = await output.get()
+        try:
+            console.print(item)
+        except Exception as e:
+            # One bad item must not stop the writer, or output.join() never returns
+            logError(ErrorIds.UNEXPECTED_ERROR, f"Eval console write failed: {e}", exc_info=True)
+        finally:
+            output.task_done()
+
+
+async def _context_pool(browser: Browser, size: int) -> asyncio.Queue[EvalSlot]:
+    """Create a fixed number of isolated contexts in one shared browser.
+
+    Eval runs start from a clean profile anyway, so non-persistent
+    contexts give each slot its own cookies/storage while paying the
+    Chromium launch cost only once for the whole suite.
+
+    Args:
+        browser: The launched browser to create contexts in.
+        size: Number of contexts to create.
+
+    Returns:
+        A queue of idle slots. Closing the browser closes every context.
+    """
+    slots = await asyncio.gather(*(_new_slot(browser) for _ in range(size)))
+    pool: asyncio.Queue[EvalSlot] = asyncio.Queue()
+    for slot in slots:
+        pool.put_nowait(slot)
+    return pool
+
+
+async def _new_slot(browser: Browser) -> EvalSlot:
+    """Create one pool slot: a fresh context and page with agents bound to them."""
+    from browser_agent.agents import create_navigator_agent, create_planner_agent
+    from browser_agent.core import ElementRegistry
+    from browser_agent.tools import create_browser_tools
+
+    context = await browser.new_context()
+    page = await context.new_page()
+    registry = ElementRegistry()
+    navigator = create_navigator_agent(create_browser_tools(page, registry, auto_approve=True))
+    return EvalSlot(
+        context=context,
+        page=page,
+        registry=registry,
+        navigator=navigator,
+        planner=create_planner_agent(navigator),
+    )
+
+
+async def _reset_slot(slot: EvalSlot) -> None:
+    """Return a slot to a blank page with no cookies or element refs.
+
+    Cheaper than relaunching a context. The tools stay bound to slot.page,
+    so tabs a previous task opened (target=_blank links, popups) are just
+    closed.
+    """
+    await slot.context.clear_cookies()
+    for extra in slot.context.pages:
+        if extra is not slot.page:
+            await extra.close()
+    await slot.page.goto("about:blank")
+    slot.registry.clear()
+
+
+async def _replace_slot(slot: EvalSlot, timeout: float) -> EvalSlot:
+    """Swap a slot that failed to reset for a fresh context in the same browser.
+
+    Args:
+        slot: The broken slot; its context is closed if a replacement is made.
+        timeout: Limit in seconds for creating the replacement and for
+            closing the old context.
+
+    Returns:
+        The new slot, or the old one if no replacement could be created, so
+        the pool never shrinks and tasks waiting on it cannot hang.
+    """
+    from browser_agent.core.logging import ErrorIds, logError, logForDebugging
 
-    # Configure SDK LLM client
     try:
-        model_provider = setup_openrouter_for_sdk()
+        browser = slot.context.browser
+        if browser is None:
+            raise RuntimeError("slot context has no browser")
+        fresh = await asyncio.wait_for(_new_slot(browser), timeout=timeout)
     except Exception as e:
-        console.print(f"\n[red]LLM setup failed: {e}[/red]")
-        console.print("[dim]Ensure OPENROUTER_API_KEY is set.[/dim]")
-        return
-
-    # Launch browser
+        logError(ErrorIds.UNEXPECTED_ERROR, f"Could not replace broken eval slot: {e}", exc_info=True)
+        return slot
     try:
-        pw = await async_playwright().start()
+        await asyncio.wait_for(slot.context.close(), timeout=timeout)
     except Exception as e:
-        console.print(f"\n[red]Playwright failed to start: {e}[/red]")
-        console.print("[dim]Try: playwright install chromium[/dim]")
-        return
+        logForDebugging(f"Could not close broken eval context: {e}", level="warning")
+    return fresh
 
-    context = None
-    try:
-        # Clean eval session
-        if EVAL_SESSION_DIR.exists():
-            shutil.rmtree(EVAL_SESSION_DIR)
-        EVAL_SESSION_DIR.mkdir(parents=True, exist_ok=True)
 
-        context = await launch_persistent_context_async(
-            pw,
-            user_data_dir=EVAL_SESSION_DIR,
-            headless=headless,
+async def _run_one(
+    task_def: TestTask,
+    index: int,
+    total: int,
+    pool: asyncio.Queue[EvalSlot],
+    model_provider: ModelProvider,
+    output: asyncio.Queue[RenderableType],
+    plan: str | None = None,
+    task_timeout: float = DEFAULT_TASK_TIMEOUT,
+) -> TaskResult:
+    """Run a single test task in a slot checked out of the pool.
+
+    The pool's size bounds how many tasks run at once; a task waits here
+    until a slot is free and returns it when done.
+
+    Args:
+        task_def: Task definition from TEST_TASKS.
+        index: Zero-based position of the task (for display).
+        total: Total number of tasks in this run (for display).
+        pool: Queue of idle eval slots (see _context_pool).
+        model_provider: The SDK model provider for OpenRouter.
+        output: Queue drained by _console_writer; all task output goes here.
+        plan: Pre-computed plan from the batch Planner. If given, the
+            Navigator runs directly on it and the per-task Planner is skipped.
+        task_timeout: Wall-clock limit in seconds for the agent run.
+
+    Returns:
+        The TaskResult for this task.
+    """
+    from agents import RunConfig, Runner
+    from agents.exceptions import MaxTurnsExceeded
+    from rich.markup import escape
+
+    from browser_agent.core.logging import ErrorIds, logError
+
+    task_name = task_def.name
+    task_desc = task_def.description
+
+    slot = await pool.get()
+    slot_broken = False
+    try:
+        output.put_nowait(
+            f"\n[bold yellow]Task {index + 1}/{total}:[/bold yellow] {escape(task_name)}\n[dim]{escape(task_desc)}[/dim]"
         )
 
-        pages = context.pages
-        page = pages[0] if pages else await context.new_page()
+        start_time = time.monotonic()
+        try:
+            # The slot is ours exclusively until it goes back to the pool. Its
+            # reset shares the task's timeout, since goto() can hang as well
+            try:
+                await asyncio.wait_for(_reset_slot(slot), timeout=task_timeout)
+            except Exception:
+                slot_broken = True
+                raise
+            remaining = task_timeout - (time.monotonic() - start_time)
+
+            run_config = RunConfig(model_provider=model_provider)
+            if plan is not None:
+                agent_run = Runner.run(slot.navigator, plan, max_turns=15, run_config=run_config)
+            else:
+                agent_run = Runner.run(slot.planner, task_desc, max_turns=15, run_config=run_config)
+            # max_turns bounds LLM round-trips; the timeout also bounds hung browser calls
+            result = await asyncio.wait_for(agent_run, timeout=remaining)
+            duration = time.monotonic() - start_time
+            output.put_nowait(f"  [green]PASS[/green] {escape(task_name)} ({duration:.1f}s) — {escape(str(result.final_output)[:100])}")
+            return TaskResult(
+                task_name=task_name,
+                task_description=task_desc,
+                success=True,
+                steps_executed=1,
+                steps_succeeded=1,
+                steps_failed=0,
+                duration_seconds=duration,
+            )
+
+        except MaxTurnsExceeded:
+            duration = time.monotonic() - start_time
+            output.put_nowait(f"  [red]FAIL[/red] {escape(task_name)} ({duration:.1f}s) — Max turns exceeded")
+            return TaskResult(
+                task_name=task_name,
+                task_description=task_desc,
+                success=False,
+                steps_executed=15,
+                steps_succeeded=0,
+                steps_failed=1,
+                error_message="Max turns exceeded (15)",
+                duration_seconds=duration,
+            )
+
+        except TimeoutError:
+            duration = time.monotonic() - start_time
+            logError(ErrorIds.TASK_TIMEOUT, f"Eval task timed out after {task_timeout:.0f}s: {task_name}")
+            output.put_nowait(f"  [red]FAIL[/red] {escape(task_name)} ({duration:.1f}s) — Timeout ({task_timeout:.0f}s)")
+            return TaskResult(
+                task_name=task_name,
+                task_description=task_desc,
+                success=False,
+                steps_executed=0,
+                steps_succeeded=0,
+                steps_failed=1,
+                error_message=f"Timeout ({task_timeout:.0f}s)",
+                duration_seconds=duration,
+            )
+
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            logError(ErrorIds.UNEXPECTED_ERROR, f"Eval task failed: {e}", exc_info=True)
+            output.put_nowait(f"  [red]FAIL[/red] {escape(task_name)} ({duration:.1f}s) — {escape(str(e))}")
+            return TaskResult(
+                task_name=task_name,
+                task_description=task_desc,
+                success=False,
+                steps_executed=0,
+                steps_succeeded=0,
+                steps_failed=1,
+                error_message=str(e),
+                duration_seconds=duration,
+            )
+    finally:
+        if slot_broken:
+            # A slot that failed to reset would fail every later task too
+            slot = await _replace_slot(slot, task_timeout)
+        pool.put_nowait(slot)
 
-        logEvent("eval_start", {"total_tasks": len(tasks), "headless": headless})
 
-        for i, task_def in enumerate(tasks):
-            task_name = task_def["name"]
-            task_desc = task_def["description"]
+def _plan_cache_key(description: str) -> str:
+    """Key a cached plan by cache version, task, planner model and instructions."""
+    from browser_agent.agents.planner import BATCH_PLANNER_INSTRUCTIONS
+    from browser_agent.core.llm import DEFAULT_SDK_MODEL
 
-            console.print(f"\n[bold yellow]Task {i + 1}/{len(tasks)}:[/bold yellow] {task_name}")
-            console.print(f"[dim]{task_desc}[/dim]")
+    payload = "\0".join(
+        [str(PLAN_CACHE_VERSION), DEFAULT_SDK_MODEL, BATCH_PLANNER_INSTRUCTIONS, description]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-            # Fresh registry and tools for each task
-            registry = ElementRegistry()
-            tools = create_browser_tools(page, registry, auto_approve=True)
 
-            navigator = create_navigator_agent(tools)
-            planner = create_planner_agent(navigator)
+def _load_plan_cache() -> dict[str, list[str]]:
+    """Load cached plan steps keyed by _plan_cache_key.
 
-            start_time = time.monotonic()
-            try:
-                run_config = RunConfig(model_provider=model_provider)
-                result = await Runner.run(planner, task_desc, max_turns=15, run_config=run_config)
-                duration = time.monotonic() - start_time
-
-                results.append(TaskResult(
-                    task_name=task_name,
-                    task_description=task_desc,
-                    success=True,
-                    steps_executed=1,
-                    steps_succeeded=1,
-                    steps_failed=0,
-                    duration_seconds=duration,
-                ))
-                console.print(f"  [green]PASS[/green] ({duration:.1f}s) — {str(result.final_output)[:100]}")
-
-            except MaxTurnsExceeded:
-                duration = time.monotonic() - start_time
-                results.append(TaskResult(
-                    task_name=task_name,
-                    task_description=task_desc,
-                    success=False,
-                    steps_executed=15,
-                    steps_succeeded=0,
-                    steps_failed=1,
-                    error_message="Max turns exceeded (15)",
-                    duration_seconds=duration,
-                ))
-                console.print(f"  [red]FAIL[/red] ({duration:.1f}s) — Max turns exceeded")
-
-            except Exception as e:
-                duration = time.monotonic() - start_time
-                logError(ErrorIds.UNEXPECTED_ERROR, f"Eval task failed: {e}", exc_info=True)
-                results.append(TaskResult(
-                    task_name=task_name,
-                    task_description=task_desc,
-                    success=False,
-                    steps_executed=0,
-                    steps_succeeded=0,
-                    steps_failed=1,
-                    error_message=str(e),
-                    duration_seconds=duration,
-                ))
-                console.print(f"  [red]FAIL[/red] ({duration:.1f}s) — {e}")
-
-        # Aggregate metrics
-        metrics = EvaluationMetrics(
-            total_tasks=len(results),
-            successful_tasks=sum(1 for r in results if r.success),
-            failed_tasks=sum(1 for r in results if not r.success),
-            total_steps=sum(r.steps_executed for r in results),
-            total_successful_steps=sum(r.steps_succeeded for r in results),
-            total_failed_steps=sum(r.steps_failed for r in results),
-            total_duration=sum(r.duration_seconds for r in results),
-        )
+    The file may be hand-edited or left over from an older version, so
+    anything that is not a list of step strings is treated as a miss.
+
+    Returns:
+        The valid cache entries; empty if the file is missing or unreadable.
+    """
+    try:
+        data = json.loads(PLAN_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key: steps
+        for key, steps in data.items()
+        if isinstance(steps, list) and all(isinstance(step, str) for step in steps)
+    }
+
+
+def _save_plan_cache(cache: dict[str, list[str]]) -> None:
+    """Persist the newest PLAN_CACHE_MAX_ENTRIES plans, ignoring write failures."""
+    from browser_agent.core.logging import logForDebugging
+
+    # Entries are kept in insertion order, so the oldest come first
+    newest = dict(list(cache.items())[-PLAN_CACHE_MAX_ENTRIES:])
+    try:
+        PLAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PLAN_CACHE_PATH.write_text(json.dumps(newest, indent=2), encoding="utf-8")
+    except OSError as e:
+        logForDebugging(f"Could not write plan cache: {e}", level="warning")
+
+
+async def _batch_plan(
+    tasks: list[TestTask],
+    model_provider: ModelProvider,
+) -> list[str | None]:
+    """Plan all tasks with a single batch Planner call.
+
+    Plans are cached on disk (PLAN_CACHE_PATH), so reruns of the same tasks
+    only send the tasks without a cached plan to the Planner — or skip the
+    call entirely.
+
+    Args:
+        tasks: Task definitions from TEST_TASKS.
+        model_provider: The SDK model provider for OpenRouter.
+
+    Returns:
+        One Navigator input per task (task description + numbered plan).
+        Entries are None for tasks the Planner returned no matching plan
+        for (or if batch planning failed); those tasks fall back to the
+        regular per-task Planner.
+    """
+    from agents import RunConfig, Runner
+
+    from browser_agent.agents import BatchPlan, create_batch_planner_agent
+    from browser_agent.core.logging import ErrorIds, logError, logEvent
+
+    task_descs = [t.description for t in tasks]
+    keys = [_plan_cache_key(desc) for desc in task_descs]
+    cache = _load_plan_cache()
+    # Deduplicate so repeated descriptions are planned once
+    missing = list(dict.fromkeys(desc for desc, key in zip(task_descs, keys) if key not in cache))
+
+    if missing:
+        start_time = time.monotonic()
+        try:
+            run_config = RunConfig(model_provider=model_provider)
+            result = await Runner.run(
+                create_batch_planner_agent(),
+                json.dumps(missing),
+                max_turns=1,
+                run_config=run_config,
+            )
+            batch = result.final_output_as(BatchPlan)
+        except Exception as e:
+            logError(ErrorIds.LLM_MALFORMED_RESPONSE, f"Batch planning failed: {e}", exc_info=True)
+            batch = None
+
+        # Match plans to tasks by the echoed task text, not by position, so a
+        # reordered or short list cannot hand a task another task's plan
+        unplanned = {desc.strip(): desc for desc in missing}
+        if batch is not None:
+            for plan in batch.plans:
+                desc = unplanned.pop(plan.task.strip(), None)
+                if desc is not None:
+                    cache[_plan_cache_key(desc)] = plan.steps
+            if unplanned:
+                logError(
+                    ErrorIds.LLM_MALFORMED_RESPONSE,
+                    f"Batch planner returned no plan for {len(unplanned)} of {len(missing)} tasks",
+                )
+        planned = len(missing) - len(unplanned)
+
+        if planned:
+            # Move this run's plans to the end so the size cap drops unused ones first
+            for key in keys:
+                if key in cache:
+                    cache[key] = cache.pop(key)
+            _save_plan_cache(cache)
+
+        logEvent("eval_batch_planned", {
+            "total_tasks": len(tasks),
+            "planned_tasks": planned,
+            "cached_tasks": len(tasks) - len(missing),
+            "duration_seconds": round(time.monotonic() - start_time, 2),
+        })
+
+    return [
+        f"{desc}\n\nPlan:\n" + "\n".join(f"{n}. {step}" for n, step in enumerate(cache[key], 1))
+        if key in cache else None
+        for desc, key in zip(task_descs, keys)
+    ]
+
+
+async def run_evaluation(
+    headless: bool = True,
+    max_tasks: int | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    batch_plans: bool = False,
+    task_timeout: float = DEFAULT_TASK_TIMEOUT,
+) -> None:
+    """Run evaluation tasks through the agent pipeline.
+
+    Tasks run concurrently in a single browser, each in a context from a
+    pool of max_concurrency isolated contexts.
+
+    Args:
+        headless: Whether to run in headless mode.
+        max_tasks: Maximum number of tasks to run (None = all).
+        max_concurrency: Maximum number of tasks running at the same time.
+        batch_plans: If True, plan all tasks in one Planner call up front
+            (reusing plans cached by earlier runs) and run each task's
+            Navigator directly on its plan.
+        task_timeout: Wall-clock limit in seconds for each task.
+    """
+    from playwright.async_api import async_playwright
+    from rich.markup import escape
+
+    from browser_agent.core import (
+        close_openrouter_for_sdk,
+        discard_session_dir,
+        setup_openrouter_for_sdk,
+    )
+    from browser_agent.core.logging import ErrorIds, logError, logEvent
+
+    tasks = TEST_TASKS[:max_tasks] if max_tasks else TEST_TASKS
 
+    # All output until the final report goes through the writer, so setup
+    # errors cannot interleave with lines from running tasks
+    output: asyncio.Queue[RenderableType] = asyncio.Queue()
+    writer = asyncio.create_task(_console_writer(output))
+    pw: Playwright | None = None
+    browser: Browser | None = None
+    cleanup: asyncio.Task[None] | None = None
+    planning: asyncio.Task[list[str | None]] | None = None
+    try:
+        # Configure SDK LLM client
+        try:
+            model_provider = setup_openrouter_for_sdk()
+        except Exception as e:
+            output.put_nowait(f"\n[red]LLM setup failed: {escape(str(e))}[/red]")
+            output.put_nowait("[dim]Ensure OPENROUTER_API_KEY is set.[/dim]")
+            return
+
+        # Launch browser
+        try:
+            pw = await async_playwright().start()
+        except Exception as e:
+            output.put_nowait(f"\n[red]Playwright failed to start: {escape(str(e))}[/red]")
+            output.put_nowait("[dim]Try: playwright install chromium[/dim]")
+            return
+
+        # Clean eval session: move the old one aside and delete it in the
+        # background instead of blocking startup on rmtree
+        old_session = discard_session_dir(EVAL_SESSION_DIR)
+        if old_session is not None:
+            cleanup = asyncio.create_task(
+                asyncio.to_thread(shutil.rmtree, old_session, ignore_errors=True)
+            )
+        EVAL_SESSION_DIR.mkdir(parents=True, exist_ok=True)
+
+        logEvent("eval_start", {"total_tasks": len(tasks), "headless": headless})
+
+        # Planning needs no browser, so the Planner call runs while the
+        # browser and its contexts start up
+        if batch_plans:
+            planning = asyncio.create_task(_batch_plan(tasks, model_provider))
+
+        # One browser for the whole suite; each pool slot is its own context
+        browser = await pw.chromium.launch(headless=headless)
+        pool = await _context_pool(browser, size=min(max_concurrency, len(tasks)))
+
+        plans: list[str | None] = [None] * len(tasks)
+        if planning is not None:
+            plans = await planning
+
+        # Metrics are aggregated online and each result is appended to a JSONL
+        # file as soon as its task finishes, so a crash loses nothing
+        metrics = EvaluationMetrics()
+        results_path = _results_path()
+        output.put_nowait(f"[dim]Per-task results: {escape(str(results_path))}[/dim]")
+        with results_path.open("a", encoding="utf-8") as results_file:
+
+            async def _run_and_record(index: int, task_def: TestTask, plan: str | None) -> None:
+                try:
+                    result = await _run_one(
+                        task_def, index, len(tasks), pool, model_provider, output, plan, task_timeout
+                    )
+                except Exception as e:
+                    logError(ErrorIds.UNEXPECTED_ERROR, f"Eval task crashed: {e}", exc_info=True)
+                    result = TaskResult(
+                        task_name=task_def.name,
+                        task_description=task_def.description,
+                        success=False,
+                        steps_executed=0,
+                        steps_succeeded=0,
+                        steps_failed=1,
+                        error_message=str(e),
+                    )
+                metrics.add_result(result)
+                results_file.write(json.dumps(asdict(result)) + "\n")
+                results_file.flush()
+
+            await asyncio.gather(*(
+                _run_and_record(i, task_def, plan)
+                for i, (task_def, plan) in enumerate(zip(tasks, plans))
+            ))
+        # The report prints directly, so wait for queued task output first
+        await output.join()
+
+        console.print(f"\n[dim]Per-task results: {escape(str(results_path))}[/dim]")
         logEvent("eval_complete", {
             "success_rate": metrics.get_success_rate(),
             "total_tasks": metrics.total_tasks,
@@ -255,11 +679,20 @@ async def run_evaluation(
 
     except Exception as e:
         logError(ErrorIds.UNEXPECTED_ERROR, f"Eval script error: {e}", exc_info=True)
-        console.print(f"\n[red]Error: {e}[/red]")
+        output.put_nowait(f"\n[red]Error: {escape(str(e))}[/red]")
     finally:
-        if context is not None:
-            await context.close()
-        await pw.stop()
+        # Flush whatever tasks queued before failing; the writer survives bad items
+        await output.join()
+        writer.cancel()
+        if planning is not None:
+            planning.cancel()
+        if browser is not None:
+            await browser.close()
+        if pw is not None:
+            await pw.stop()
+        await close_openrouter_for_sdk()
+        if cleanup is not None:
+            await cleanup
 
 
 async def main() -> None:
@@ -284,9 +717,28 @@ async def main() -> None:
         default=None,
         help="Number of tasks to run (default: all)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum number of tasks to run in parallel (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--batch-plans",
+        action="store_true",
+        help="Plan all tasks in a single (cached) Planner call, then run Navigators in parallel",
+    )
+    parser.add_argument(
+        "--task-timeout",
+        type=float,
+        default=DEFAULT_TASK_TIMEOUT,
+        help=f"Per-task wall-clock limit in seconds (default: {DEFAULT_TASK_TIMEOUT:.0f})",
+    )
 
     args = parser.parse_args()
 
+    from rich.panel import Panel
+
     console.print(Panel.fit(
         "[bold cyan]Browser Agent Evaluation[/bold cyan]\n"
         "[dim]Automated testing and metrics collection[/dim]",
@@ -298,8 +750,11 @@ async def main() -> None:
     await run_evaluation(
         headless=headless,
         max_tasks=args.tasks,
+        max_concurrency=max(1, args.concurrency),
+        batch_plans=args.batch_plans,
+        task_timeout=args.task_timeout,
     )
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
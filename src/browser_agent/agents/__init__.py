@@ -1,9 +1,17 @@
 """Browser Agent sub-agents."""
 
 from browser_agent.agents.navigator import create_navigator_agent
-from browser_agent.agents.planner import create_planner_agent
+from browser_agent.agents.planner import (
+    BatchPlan,
+    TaskPlan,
+    create_batch_planner_agent,
+    create_planner_agent,
+)
 
 __all__ = [
+    "BatchPlan",
+    "TaskPlan",
+    "create_batch_planner_agent",
     "create_navigator_agent",
     "create_planner_agent",
 ]
@@ -3,9 +3,14 @@
 This module provides a factory function that creates a Planner agent
 using the OpenAI Agents SDK. The Planner receives a user task, creates
 a plan, and hands off execution to the Navigator agent.
+
+It also provides a batch Planner that plans several independent tasks
+in a single LLM call and returns the plans as structured output, so
+callers (e.g. the eval script) can dispatch Navigator runs themselves.
 """
 
 from agents import Agent
+from pydantic import BaseModel
 
 from browser_agent.core.llm import DEFAULT_SDK_MODEL
 
@@ -62,3 +67,57 @@ def create_planner_agent(navigator_agent: Agent) -> Agent:  # type: ignore[type-
         handoffs=[navigator_agent],
         model=DEFAULT_SDK_MODEL,
     )
+
+
+BATCH_PLANNER_INSTRUCTIONS = """\
+You are Task Planner — an agent that receives SEVERAL independent browser automation tasks \
+at once and creates a clear, high-level execution plan for each of them.
+
+## Input
+A JSON array of task descriptions.
+
+## Your Role
+For EACH task, in the same order as the input, break it into 3–10 high-level steps.
+Return exactly one plan per task. Do not merge, skip, or reorder tasks.
+Set each plan's `task` to its input task description, copied exactly — plans are \
+matched to tasks by this field.
+
+## Planning Rules
+- Steps must be GENERAL and describe WHAT to do, not HOW.
+- Never include specific element IDs (like "elem-0") — the Navigator will discover them.
+- Never include CSS selectors or XPath expressions.
+- Never assume specific page layouts — the Navigator observes the page in real time.
+- Start with navigation to the appropriate website if the task implies one.
+- End with a clear success criterion (what the user should see or get back).
+"""
+
+
+class TaskPlan(BaseModel):
+    """High-level plan for a single task produced by the batch Planner."""
+
+    task: str
+    steps: list[str]
+
+
+class BatchPlan(BaseModel):
+    """Structured output of the batch Planner: one plan per input task, in order."""
+
+    plans: list[TaskPlan]
+
+
+def create_batch_planner_agent() -> Agent:  # type: ignore[type-arg]
+    """Create a Planner agent that plans several tasks in one call.
+
+    Unlike create_planner_agent(), this agent has no handoffs: it returns
+    a BatchPlan as structured output, and the caller runs a Navigator
+    per plan.
+
+    Returns:
+        An SDK Agent that maps a JSON array of tasks to a BatchPlan.
+    """
+    return Agent(
+        name="Batch Task Planner",
+        instructions=BATCH_PLANNER_INSTRUCTIONS,
+        output_type=BatchPlan,
+        model=DEFAULT_SDK_MODEL,
+    )
@@ -1,67 +1,204 @@
 """CLI entry point for browser-agent."""
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import shutil
 from pathlib import Path
 
 from rich.console import Console
 
-from browser_agent.core.browser import launch_persistent_context
-from browser_agent.core.logging import ErrorIds, logError
-from playwright.sync_api import sync_playwright
+from browser_agent.runtime import run, wait_for_shutdown
+
+# Heavy imports (agents SDK, Playwright, the rest of browser_agent) are
+# deferred to _run() so --help and argument errors return immediately.
 
 console = Console()
 
 DEFAULT_SESSION_DIR = Path.home() / ".browser-agent" / "session"
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Browser Agent - Autonomous AI browser controller"
     )
+    parser.add_argument(
+        "task",
+        nargs="?",
+        help="The task to perform (if not provided, will prompt interactively)",
+    )
     parser.add_argument(
         "--session-dir",
-        type=str,
-        default=str(DEFAULT_SESSION_DIR),
-        help=f"Directory for persistent session data (default: {DEFAULT_SESSION_DIR})",
+        type=Path,
+        default=DEFAULT_SESSION_DIR,
+        help="Directory for persistent browser session (default: ~/.browser-agent/session)",
     )
     parser.add_argument(
         "--headless",
         action="store_true",
         help="Run in headless mode (default: visible browser)",
     )
+    parser.add_argument(
+        "--auto-approve",
+        action="store_true",
+        help="Auto-approve all actions without confirmation (use with caution)",
+    )
+    parser.add_argument(
+        "--clean-cache",
+        action="store_true",
+        help="Clear the browser session cache before starting",
+    )
+
+    return parser
+
 
-    args = parser.parse_args()
+async def _run(args: argparse.Namespace) -> None:
+    """Run the browser agent on one task.
 
-    # For now, just show a message and test browser launch
-    console.print("[bold cyan]Browser Agent[/bold cyan] - Autonomous AI browser controller")
-    console.print(f"Session directory: [dim]{args.session_dir}[/dim]")
-    console.print("Use [bold]scripts/run.py[/bold] to run the agent interactively")
+    Args:
+        args: Parsed command-line arguments.
+    """
+    from rich.panel import Panel
+
+    # Get task from command line or prompt
+    task = args.task
+    if not task:
+        console.print(Panel.fit(
+            "[bold cyan]Browser Agent[/bold cyan]\n"
+            "[dim]Autonomous AI browser controller[/dim]",
+            title="Welcome"
+        ))
+        task = console.input("\n[bold yellow]Enter a task for the agent:[/bold yellow] ")
+        if not task.strip():
+            console.print("[red]No task provided. Exiting.[/red]")
+            return
+
+    # Only load the SDK, Playwright and browser_agent once there is a task to run
+    from agents import RunConfig, Runner
+    from agents.exceptions import MaxTurnsExceeded
+    from playwright.async_api import async_playwright
+
+    from browser_agent.agents import create_navigator_agent, create_planner_agent
+    from browser_agent.core import (
+        ElementRegistry,
+        close_openrouter_for_sdk,
+        discard_session_dir,
+        launch_persistent_context_async,
+        setup_openrouter_for_sdk,
+    )
+    from browser_agent.core.logging import ErrorIds, logError, logEvent
+    from browser_agent.tools import create_browser_tools
 
-    # Test browser launch
+    # Display the task
+    console.print(f"\n[bold green]Task:[/bold green] {task}")
+
+    # Session directory setup
+    session_dir = args.session_dir
+    # Move the old session aside and delete it in the background instead of
+    # blocking startup on rmtree
+    cleanup: asyncio.Task[None] | None = None
+    if args.clean_cache and session_dir.exists():
+        console.print(f"[yellow]Cleaning session cache: {session_dir}[/yellow]")
+        old_session = discard_session_dir(session_dir)
+        if old_session is not None:
+            cleanup = asyncio.create_task(
+                asyncio.to_thread(shutil.rmtree, old_session, ignore_errors=True)
+            )
+    session_dir.mkdir(parents=True, exist_ok=True)
+
+    console.print(f"\n[dim]Session directory: {session_dir}[/dim]")
+    console.print(f"[dim]Headless mode: {args.headless}[/dim]")
+    if args.auto_approve:
+        console.print("[yellow][dim]Auto-approve mode: ENABLED[/dim][/yellow]")
+
+    # Configure SDK LLM client (returns OpenAIProvider for RunConfig)
+    try:
+        model_provider = setup_openrouter_for_sdk()
+    except Exception as e:
+        console.print(f"\n[red]LLM setup failed: {e}[/red]")
+        console.print("[dim]Ensure OPENROUTER_API_KEY is set.[/dim]")
+        return
+
+    # Launch browser (async)
+    try:
+        pw = await async_playwright().start()
+    except Exception as e:
+        console.print(f"\n[red]Playwright failed to start: {e}[/red]")
+        console.print("[dim]Try: playwright install chromium[/dim]")
+        return
     context = None
-    with sync_playwright() as p:
+    try:
+        console.print("\n[yellow]Launching browser...[/yellow]")
+        context = await launch_persistent_context_async(
+            pw,
+            user_data_dir=session_dir,
+            headless=args.headless,
+        )
+
+        # Get or create the page
+        pages = context.pages
+        page = pages[0] if pages else await context.new_page()
+
+        console.print("[green]Browser launched successfully![/green]")
+
+        # Initialize agent components
+        registry = ElementRegistry()
+        tools = create_browser_tools(page, registry, auto_approve=args.auto_approve)
+
+        # Create agents: Navigator (has tools) -> Planner (hands off to Navigator)
+        navigator = create_navigator_agent(tools)
+        planner = create_planner_agent(navigator)
+
+        # Run the ReAct loop
+        logEvent("agent_start", {"task": task})
+        console.print("\n[yellow]Starting agent...[/yellow]")
         try:
-            console.print("\n[yellow]Launching browser...[/yellow]")
-            context = launch_persistent_context(
-                p,
-                user_data_dir=args.session_dir,
-                headless=args.headless,
-            )
-            console.print("[green]Browser launched successfully![/green]")
-            console.print("[dim]Press Ctrl+C to close...[/dim]")
-
-            # Keep browser open until user interrupts
-            context.wait_for_event("close", timeout=0)
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Closing browser...[/yellow]")
-        except Exception as e:
-            logError(ErrorIds.UNEXPECTED_ERROR, f"CLI error: {e}", exc_info=True)
-            console.print(f"\n[red]Error: {e}[/red]")
-        finally:
-            if context is not None:
-                context.close()
-            console.print("[green]Done.[/green]")
+            run_config = RunConfig(model_provider=model_provider)
+            result = await Runner.run(planner, task, max_turns=30, run_config=run_config)
+            logEvent("agent_complete", {"task": task, "output": str(result.final_output)[:200]})
+            console.print("\n")
+            console.print(Panel(
+                f"[bold green]Task Complete![/bold green]\n\n"
+                f"[dim]{result.final_output}[/dim]",
+                title="Summary"
+            ))
+        except MaxTurnsExceeded:
+            logEvent("agent_max_turns", {"task": task, "max_turns": 30})
+            console.print("\n")
+            console.print(Panel(
+                "[bold yellow]Agent reached the maximum turn limit (30 turns).[/bold yellow]\n\n"
+                "The task may be partially complete. Try breaking it into smaller steps "
+                "or increasing the turn limit.",
+                title="Turn Limit Reached",
+                border_style="yellow"
+            ))
+
+        # Keep browser open for observation
+        if not args.headless:
+            console.print("\n[dim]Press Ctrl+C to close the browser...[/dim]")
+            await wait_for_shutdown(context)
+            console.print("\n[yellow]Shutting down...[/yellow]")
+
+    except Exception as e:
+        logError(ErrorIds.UNEXPECTED_ERROR, f"CLI error: {e}", exc_info=True)
+        console.print(f"\n[red]Error: {e}[/red]")
+        import traceback
+        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+    finally:
+        if context is not None:
+            await context.close()
+        await pw.stop()
+        await close_openrouter_for_sdk()
+        if cleanup is not None:
+            await cleanup
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
+    run(_run(args))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Browser Agent core components."""
 
 from browser_agent.core.browser import (
+    discard_session_dir,
     launch_persistent_context,
     launch_persistent_context_async,
 )
@@ -8,20 +9,29 @@ from browser_agent.core.logging import ErrorIds, logError, logEvent, logForDebug
 from browser_agent.core.llm import (
     DEFAULT_MODEL,
     DEFAULT_SDK_MODEL,
+    acall_llm,
     call_llm,
+    close_openrouter_for_sdk,
+    get_async_openrouter_client,
     get_openrouter_client,
+    llm_cache_clear,
     setup_openrouter_for_sdk,
 )
 from browser_agent.core.registry import ElementRegistry, StaleElementError
 
 __all__ = [
+    "discard_session_dir",
     "launch_persistent_context",
     "launch_persistent_context_async",
     "get_openrouter_client",
+    "get_async_openrouter_client",
     "call_llm",
+    "acall_llm",
+    "llm_cache_clear",
     "DEFAULT_MODEL",
     "DEFAULT_SDK_MODEL",
     "setup_openrouter_for_sdk",
+    "close_openrouter_for_sdk",
     "ElementRegistry",
     "StaleElementError",
     "logError",
@@ -4,6 +4,7 @@ This module provides functions to launch and manage Playwright browser contexts
 with persistent storage for session data (cookies, localStorage, etc.).
 """
 
+import uuid
 from pathlib import Path
 
 from playwright.async_api import BrowserContext as AsyncBrowserContext
@@ -80,3 +81,25 @@ async def launch_persistent_context_async(
         headless=headless,
     )
     return context
+
+
+def discard_session_dir(user_data_dir: str | Path) -> Path | None:
+    """Move a session directory out of the way so a fresh one can be used.
+
+    Renaming is O(1) regardless of profile size, unlike deleting a
+    Chromium profile's many small files. The caller is responsible for
+    deleting the returned directory, typically in a background thread
+    (e.g. asyncio.to_thread(shutil.rmtree, path)).
+
+    Args:
+        user_data_dir: The session directory to discard.
+
+    Returns:
+        The path the old directory was moved to, or None if it did not exist.
+    """
+    path = Path(user_data_dir)
+    if not path.exists():
+        return None
+    trash = path.with_name(f".{path.name}.trash-{uuid.uuid4().hex[:8]}")
+    path.rename(trash)
+    return trash
@@ -3,7 +3,10 @@
 This module provides LLM client setup for OpenRouter API integration.
 """
 
+import hashlib
+import json
 import os
+from collections import OrderedDict
 from typing import Any
 
 from openai import AsyncOpenAI, OpenAI
@@ -19,12 +22,31 @@ DEFAULT_MODEL = "anthropic/claude-3.5-sonnet"
 # Default model for OpenAI Agents SDK usage
 DEFAULT_SDK_MODEL = "google/gemini-2.5-flash"
 
+# Per-request timeout (seconds) for OpenRouter calls made by the SDK
+SDK_REQUEST_TIMEOUT = 120.0
+
+# Process-wide AsyncOpenAI client for the SDK and acall_llm. Reusing one client
+# keeps its HTTP connection pool (and TLS sessions) alive across Runner.run calls.
+_sdk_client: AsyncOpenAI | None = None
+
+# Process-wide sync client for call_llm, for the same reason
+_client: OpenAI | None = None
+
+# call_llm/acall_llm responses are cached only for near-deterministic requests
+# (temperature at or below this); sampled responses are expected to vary
+LLM_CACHE_MAX_TEMPERATURE = 0.1
+
+# Maximum number of cached call_llm/acall_llm responses (LRU eviction)
+LLM_CACHE_SIZE = 256
+
+_response_cache: OrderedDict[str, str] = OrderedDict()
+
 
 def setup_openrouter_for_sdk() -> OpenAIProvider:
     """Configure the OpenAI Agents SDK to use OpenRouter as the LLM backend.
 
-    Creates an AsyncOpenAI client pointed at OpenRouter's OpenAI-compatible API,
-    sets it as the SDK default, and returns an OpenAIProvider that bypasses
+    Creates (once per process) an AsyncOpenAI client pointed at OpenRouter's
+    OpenAI-compatible API, sets it as the SDK default, and returns an OpenAIProvider that bypasses
     the SDK's MultiProvider prefix parsing (which would strip the provider
     prefix from model names like 'google/gemini-...' that OpenRouter needs).
 
@@ -34,6 +56,24 @@ def setup_openrouter_for_sdk() -> OpenAIProvider:
     Raises:
         ValueError: If OPENROUTER_API_KEY is not set.
     """
+    client = get_async_openrouter_client()
+    set_default_openai_client(client, use_for_tracing=False)
+    return OpenAIProvider(openai_client=client, use_responses=False)
+
+
+def get_async_openrouter_client() -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client configured for OpenRouter.
+
+    The same client backs the SDK (see setup_openrouter_for_sdk) and
+    acall_llm, so both share one HTTP connection pool.
+
+    Returns:
+        The shared AsyncOpenAI client instance configured for OpenRouter.
+
+    Raises:
+        ValueError: If OPENROUTER_API_KEY is not set.
+    """
+    global _sdk_client
     api_key = os.environ.get("OPENROUTER_API_KEY")
     if not api_key:
         raise ValueError(
@@ -41,25 +81,40 @@ def setup_openrouter_for_sdk() -> OpenAIProvider:
             "Get one at https://openrouter.ai/keys"
         )
 
-    client = AsyncOpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
-    set_default_openai_client(client, use_for_tracing=False)
-    return OpenAIProvider(openai_client=client, use_responses=False)
+    if _sdk_client is None:
+        _sdk_client = AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+            timeout=SDK_REQUEST_TIMEOUT,
+        )
+    return _sdk_client
+
+
+async def close_openrouter_for_sdk() -> None:
+    """Close the shared SDK client and its pooled HTTP connections.
+
+    Safe to call even if setup_openrouter_for_sdk() was never called.
+    """
+    global _sdk_client
+    if _sdk_client is not None:
+        await _sdk_client.close()
+        _sdk_client = None
 
 
 def get_openrouter_client() -> OpenAI:
     """Get an OpenAI client configured for OpenRouter.
 
-    The OPENROUTER_API_KEY environment variable must be set.
+    The OPENROUTER_API_KEY environment variable must be set. The client is
+    created on first use and shared afterwards, so repeated calls reuse its
+    HTTP connection pool instead of opening a new connection each time.
 
     Returns:
-        An OpenAI client instance configured for OpenRouter.
+        The shared OpenAI client instance configured for OpenRouter.
 
     Raises:
         ValueError: If OPENROUTER_API_KEY is not set.
     """
+    global _client
     api_key = os.environ.get("OPENROUTER_API_KEY")
     if not api_key:
         raise ValueError(
@@ -67,10 +122,12 @@ def get_openrouter_client() -> OpenAI:
             "Get one at https://openrouter.ai/keys"
         )
 
-    return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    if _client is None:
+        _client = OpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+        )
+    return _client
 
 
 def call_llm(
@@ -81,6 +138,10 @@ def call_llm(
 ) -> str:
     """Call the LLM with the given messages.
 
+    Requests with temperature at or below LLM_CACHE_MAX_TEMPERATURE are
+    answered from an in-process LRU cache when an identical request has
+    already succeeded.
+
     Args:
         messages: List of message dictionaries with 'role' and 'content' keys.
         model: Model name to use. If None, uses DEFAULT_MODEL.
@@ -94,6 +155,11 @@ def call_llm(
     if model is None:
         model = DEFAULT_MODEL
 
+    key = _cache_key(model, temperature, max_tokens, messages)
+    if key is not None and key in _response_cache:
+        _response_cache.move_to_end(key)
+        return _response_cache[key]
+
     client = get_openrouter_client()
 
     try:
@@ -107,6 +173,83 @@ def call_llm(
         logError(ErrorIds.LLM_API_ERROR, f"LLM API call failed: {e}", exc_info=True)
         raise
 
+    return _cache_response(key, _response_text(response))
+
+
+async def acall_llm(
+    messages: list[dict[str, Any]],  # type: ignore[arg-type]
+    model: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+) -> str:
+    """Async version of call_llm.
+
+    Does not block the event loop, so independent calls can be overlapped
+    with asyncio.gather(). Shares call_llm's response cache.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Model name to use. If None, uses DEFAULT_MODEL.
+        temperature: Sampling temperature (0-2).
+        max_tokens: Maximum tokens to generate.
+
+    Returns:
+        The LLM's response text.
+
+    """
+    if model is None:
+        model = DEFAULT_MODEL
+
+    key = _cache_key(model, temperature, max_tokens, messages)
+    if key is not None and key in _response_cache:
+        _response_cache.move_to_end(key)
+        return _response_cache[key]
+
+    client = get_async_openrouter_client()
+
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,  # type: ignore[arg-type]
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    except Exception as e:
+        logError(ErrorIds.LLM_API_ERROR, f"LLM API call failed: {e}", exc_info=True)
+        raise
+
+    return _cache_response(key, _response_text(response))
+
+
+def llm_cache_clear() -> None:
+    """Drop all cached call_llm/acall_llm responses."""
+    _response_cache.clear()
+
+
+def _cache_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    messages: list[dict[str, Any]],
+) -> str | None:
+    """Hash a call_llm request into a cache key, or None if it isn't cacheable."""
+    if temperature > LLM_CACHE_MAX_TEMPERATURE:
+        return None
+    payload = json.dumps([model, temperature, max_tokens, messages], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_response(key: str | None, text: str) -> str:
+    """Store a response under key (if cacheable and non-empty) and return it."""
+    if key is not None and text:
+        _response_cache[key] = text
+        if len(_response_cache) > LLM_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return text
+
+
+def _response_text(response: Any) -> str:
+    """Extract the first choice's text from a chat completion response."""
     if not response.choices:
         logError(ErrorIds.LLM_MALFORMED_RESPONSE, "LLM returned empty choices list")
         return ""
@@ -4,6 +4,7 @@ This module provides structured logging for errors, debugging, and analytics.
 All logging functions use the standard library logging module for flexibility.
 """
 
+import json
 import logging
 import sys
 from typing import Any
@@ -41,31 +42,30 @@ class ErrorIds:
 
     # General errors
     UNEXPECTED_ERROR = "ERR_UNEXPECTED"
+    TASK_TIMEOUT = "ERR_TASK_TIMEOUT"
     KEYBOARD_INTERRUPT = "KEYBOARD_INTERRUPT"
 
 
-# Configure root logger for the browser agent
-_logger: logging.Logger | None = None
+# Configure root logger for the browser agent once, at import
+_logger = logging.getLogger("browser_agent")
+if not _logger.handlers:
+    # The logger level tracks the most verbose handler, so isEnabledFor()
+    # can skip building messages that no handler would emit
+    _logger.setLevel(logging.INFO)
 
+    # Console handler for user-facing logs
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setLevel(logging.INFO)
+    _console_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    _logger.addHandler(_console_handler)
 
-def _get_logger() -> logging.Logger:
-    """Get or create the logger instance."""
-    global _logger
-    if _logger is None:
-        _logger = logging.getLogger("browser_agent")
-        _logger.setLevel(logging.DEBUG)
-
-        # Console handler for user-facing logs
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        console_handler.setFormatter(console_formatter)
-        _logger.addHandler(console_handler)
 
-    return _logger
+def _format_context(context: dict[str, Any]) -> str:
+    """Serialize log context as compact JSON (non-JSON values via str())."""
+    return json.dumps(context, default=str, ensure_ascii=False, separators=(",", ":"))
 
 
 def logError(
@@ -82,13 +82,13 @@ def logError(
         exc_info: If True, include exception info in the log.
         extra: Optional additional context as key-value pairs.
     """
-    logger = _get_logger()
+    if not _logger.isEnabledFor(logging.ERROR):
+        return
     log_msg = f"[{error_id}] {message}"
     if extra:
-        extra_str = ", ".join(f"{k}={v}" for k, v in extra.items())
-        log_msg += f" | {extra_str}"
+        log_msg += f" | {_format_context(extra)}"
 
-    logger.error(log_msg, exc_info=exc_info)
+    _logger.error(log_msg, exc_info=exc_info)
 
     # In production, this would also send to Sentry/error tracking service
     # Example: sentry_sdk.capture_exception(error_id, message, extra)
@@ -106,14 +106,14 @@ def logForDebugging(
         level: Log level - "debug", "info", "warning", or "error".
         extra: Optional additional context as key-value pairs.
     """
-    logger = _get_logger()
+    log_level = getattr(logging, level.upper(), logging.DEBUG)
+    if not _logger.isEnabledFor(log_level):
+        return
     log_msg = message
     if extra:
-        extra_str = ", ".join(f"{k}={v}" for k, v in extra.items())
-        log_msg += f" | {extra_str}"
+        log_msg += f" | {_format_context(extra)}"
 
-    log_level = getattr(logging, level.upper(), logging.DEBUG)
-    logger.log(log_level, log_msg)
+    _logger.log(log_level, log_msg)
 
 
 def logEvent(
@@ -126,13 +126,13 @@ def logEvent(
         event_name: The name of the event (e.g., "action_executed", "overlay_dismissed").
         properties: Optional event properties as key-value pairs.
     """
-    logger = _get_logger()
+    if not _logger.isEnabledFor(logging.INFO):
+        return
     log_msg = f"[EVENT] {event_name}"
     if properties:
-        props_str = ", ".join(f"{k}={v}" for k, v in properties.items())
-        log_msg += f" | {props_str}"
+        log_msg += f" | {_format_context(properties)}"
 
-    logger.info(log_msg)
+    _logger.info(log_msg)
 
     # In production, this would also send to analytics service
     # Example: analytics.track(event_name, properties)
@@ -145,11 +145,10 @@ def set_log_level(level: str | int) -> None:
         level: Log level as string ("debug", "info", "warning", "error")
                or int (logging.DEBUG, logging.INFO, etc.).
     """
-    logger = _get_logger()
     if isinstance(level, str):
         level = getattr(logging, level.upper(), logging.INFO)
-    logger.setLevel(level)
-    logger.handlers[0].setLevel(level)
+    _logger.setLevel(level)
+    _logger.handlers[0].setLevel(level)
 
 
 def enable_file_logging(filepath: str) -> None:
@@ -158,7 +157,6 @@ def enable_file_logging(filepath: str) -> None:
     Args:
         filepath: Path to the log file.
     """
-    logger = _get_logger()
     file_handler = logging.FileHandler(filepath)
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(
@@ -166,4 +164,5 @@ def enable_file_logging(filepath: str) -> None:
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    _logger.addHandler(file_handler)
+    _logger.setLevel(logging.DEBUG)
@@ -0,0 +1,75 @@
+"""Event-loop bootstrap and shutdown helpers shared by the CLI and scripts.
+
+Kept outside browser_agent.core so importing it does not pull in the
+agents SDK or Playwright; entry points use it before parsing arguments.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop when it is installed, which cuts per-await overhead on the
+    CDP/HTTP-heavy agent loop; falls back to the default asyncio loop.
+
+    Args:
+        main: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+async def wait_for_shutdown(context: BrowserContext) -> None:
+    """Sleep until Ctrl+C (SIGINT) or the browser window is closed.
+
+    Uses an asyncio.Event set from a loop signal handler, so the event
+    loop stays idle instead of waking up to poll. The SIGINT handler that
+    was installed before (e.g. asyncio.Runner's) is restored afterwards.
+
+    Args:
+        context: The browser context; closing it also ends the wait.
+    """
+    stop_event = asyncio.Event()
+    context.on("close", lambda _: stop_event.set())
+    loop = asyncio.get_running_loop()
+    previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop_event.set)
+    except (NotImplementedError, RuntimeError):
+        # No loop signal handlers (Windows, or not the main thread). Ctrl+C
+        # then cancels the main task under asyncio.Runner, or raises
+        # KeyboardInterrupt under a plain loop; either one ends the wait
+        try:
+            await stop_event.wait()
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None:
+                current.uncancel()
+        except KeyboardInterrupt:
+            pass
+        return
+    try:
+        await stop_event.wait()
+    finally:
+        # remove_signal_handler() resets SIGINT to the default handler
+        loop.remove_signal_handler(signal.SIGINT)
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
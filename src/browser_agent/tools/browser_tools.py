@@ -13,6 +13,7 @@ from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from browser_agent.core.logging import ErrorIds, logError, logForDebugging
 from browser_agent.core.registry import ElementRegistry, StaleElementError
+from browser_agent.models.element import InteractiveElement
 from browser_agent.tools.observe import _extract_interactive_elements
 from browser_agent.tools.safety import ask_user_confirmation, is_destructive_action
 
@@ -33,46 +34,53 @@ def create_browser_tools(page: Page, registry: ElementRegistry, auto_approve: bo
         A list of FunctionTool instances for the SDK agent.
     """
 
-    @function_tool
-    async def browser_observe() -> str:
-        """Observe the current page state. Returns the page title, URL, a list of interactive elements with IDs, and visible text.
-
-        ALWAYS call this tool first before taking any action on the page.
-        Use the element IDs (e.g., 'elem-0') from the observation to interact
-        with elements via browser_click, browser_type, etc.
-        After any navigation or major page change, call this again to get fresh element references.
-        """
-        url = page.url
-        title = await page.title()
-
-        # Get ARIA snapshot and parse interactive elements
+    async def _read_elements() -> list[InteractiveElement]:
+        """Get the ARIA snapshot and parse interactive elements from it."""
         try:
             aria_yaml = await page.locator("body").aria_snapshot()
-            elements = _extract_interactive_elements(aria_yaml, max_elements=60)
+            return _extract_interactive_elements(aria_yaml, max_elements=60)
         except Exception as e:
             logError(
                 ErrorIds.ARIA_SNAPSHOT_PARSE_FAILED,
                 f"Failed to get ARIA snapshot: {e}",
                 exc_info=True,
             )
-            elements = []
-
-        # Register elements with the registry (assigns refs, tracks version)
-        registry.register_elements(elements)
+            return []
 
-        # Get visible text excerpt
+    async def _read_visible_text() -> str:
+        """Get the page's visible text, whitespace-collapsed and truncated."""
         try:
             text = await page.inner_text("body", timeout=5000)
-            text = " ".join(text.split())
-            if len(text) > 3000:
-                text = text[:3000] + "..."
         except Exception as e:
             logError(
                 ErrorIds.VISIBLE_TEXT_EXTRACTION_FAILED,
                 f"Failed to extract visible text: {e}",
                 exc_info=True,
             )
-            text = "[Text extraction failed -- page content may exist but could not be read]"
+            return "[Text extraction failed -- page content may exist but could not be read]"
+        text = " ".join(text.split())
+        if len(text) > 3000:
+            text = text[:3000] + "..."
+        return text
+
+    @function_tool
+    async def browser_observe() -> str:
+        """Observe the current page state. Returns the page title, URL, a list of interactive elements with IDs, and visible text.
+
+        ALWAYS call this tool first before taking any action on the page.
+        Use the element IDs (e.g., 'elem-0') from the observation to interact
+        with elements via browser_click, browser_type, etc.
+        After any navigation or major page change, call this again to get fresh element references.
+        """
+        url = page.url
+        # Title, ARIA snapshot and visible text are independent reads, so
+        # issue them together rather than paying three sequential round-trips
+        title, elements, text = await asyncio.gather(
+            page.title(), _read_elements(), _read_visible_text()
+        )
+
+        # Register elements with the registry (assigns refs, tracks version)
+        registry.register_elements(elements)
 
         # Format output for the LLM
         lines = [f"Page: {title}", f"URL: {url}", "", "Interactive Elements:"]
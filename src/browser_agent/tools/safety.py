@@ -6,7 +6,7 @@ level (not the LLM level) — the agent cannot bypass it.
 """
 
 import asyncio
-import string
+import re
 
 from browser_agent.core.logging import logEvent, logForDebugging
 
@@ -26,13 +26,20 @@ _DESTRUCTIVE_KEYWORDS = frozenset({
     "trash",
 })
 
+# All keywords as one case-insensitive alternation, matched as whole words.
+# \b treats punctuation as a boundary, so "Delete?" matches but "ordering" doesn't.
+_DESTRUCTIVE_PATTERN = re.compile(
+    r"\b(?:" + "|".join(sorted(_DESTRUCTIVE_KEYWORDS)) + r")\b",
+    re.IGNORECASE,
+)
+
 
 def is_destructive_action(action_description: str) -> bool:
     """Check if an action description contains destructive keywords.
 
     This is a synchronous, deterministic check — no LLM involved.
-    Strips punctuation from each word before matching so that
-    "Delete?" and "Submit!" are correctly detected.
+    Keywords are matched as whole words in a single precompiled regex
+    scan, so surrounding punctuation ("Delete?", "Submit!") still matches.
 
     Args:
         action_description: Description of the action (e.g., element role + name).
@@ -40,12 +47,11 @@ def is_destructive_action(action_description: str) -> bool:
     Returns:
         True if the action matches a destructive keyword, False otherwise.
     """
-    words = action_description.lower().split()
-    stripped = [w.strip(string.punctuation) for w in words]
-    result = any(word in _DESTRUCTIVE_KEYWORDS for word in stripped)
+    matched_words = [m.lower() for m in _DESTRUCTIVE_PATTERN.findall(action_description)]
+    result = bool(matched_words)
     logForDebugging(
         f"Safety check: {action_description!r} -> {'DESTRUCTIVE' if result else 'safe'}",
-        extra={"matched_words": [w for w in stripped if w in _DESTRUCTIVE_KEYWORDS]},
+        extra={"matched_words": matched_words},
     )
     return result
 
@@ -74,11 +80,14 @@ async def ask_user_confirmation(action_description: str, auto_approve: bool = Fa
 
     def _prompt() -> bool:
         try:
-            console.print(
+            # Warning and question go out as one prompt rather than two prints
+            return Confirm.ask(
                 f"\n[bold red]⚠ Safety Check:[/bold red] "
-                f"The agent wants to interact with: [bold]{action_description}[/bold]"
+                f"The agent wants to interact with: [bold]{action_description}[/bold]\n"
+                "[bold yellow]Allow this action?[/bold yellow]",
+                console=console,
+                default=False,
             )
-            return Confirm.ask("[bold yellow]Allow this action?[/bold yellow]", default=False)
         except (EOFError, KeyboardInterrupt):
             return False
 
@@ -0,0 +1,32 @@
+"""Tests for browser session helpers."""
+
+from pathlib import Path
+
+from browser_agent.core.browser import discard_session_dir
+
+
+class TestDiscardSessionDir:
+    def test_moves_existing_dir_aside(self, tmp_path: Path) -> None:
+        session = tmp_path / "session"
+        (session / "Default").mkdir(parents=True)
+        (session / "Default" / "Cookies").write_text("data")
+
+        trash = discard_session_dir(session)
+
+        assert trash is not None
+        assert not session.exists()
+        assert trash.parent == tmp_path
+        assert (trash / "Default" / "Cookies").read_text() == "data"
+
+    def test_missing_dir_returns_none(self, tmp_path: Path) -> None:
+        assert discard_session_dir(tmp_path / "missing") is None
+
+    def test_repeated_discards_do_not_collide(self, tmp_path: Path) -> None:
+        session = tmp_path / "session"
+        session.mkdir()
+        first = discard_session_dir(session)
+        session.mkdir()
+        second = discard_session_dir(session)
+
+        assert first is not None and second is not None
+        assert first != second
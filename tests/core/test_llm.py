@@ -0,0 +1,122 @@
+"""Tests for LLM integration helpers."""
+
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_agent.core import llm
+
+
+class TestSetupOpenrouterForSdk:
+    @pytest.mark.asyncio
+    async def test_reuses_client_across_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        monkeypatch.setattr(llm, "_sdk_client", None)
+
+        llm.setup_openrouter_for_sdk()
+        first = llm._sdk_client
+        llm.setup_openrouter_for_sdk()
+        assert first is not None
+        assert llm._sdk_client is first
+
+        await llm.close_openrouter_for_sdk()
+        assert llm._sdk_client is None
+
+    def test_missing_api_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="OPENROUTER_API_KEY"):
+            llm.setup_openrouter_for_sdk()
+
+
+class TestGetOpenrouterClient:
+    def test_reuses_client_across_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        monkeypatch.setattr(llm, "_client", None)
+
+        first = llm.get_openrouter_client()
+        assert llm.get_openrouter_client() is first
+
+    def test_missing_api_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="OPENROUTER_API_KEY"):
+            llm.get_openrouter_client()
+
+
+def _completion(content: str | None) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()] if content is not None else []
+    if content is not None:
+        response.choices[0].message.content = content
+    return response
+
+
+class TestAcallLlm:
+    @pytest.mark.asyncio
+    async def test_returns_response_text(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=_completion("hello"))
+        monkeypatch.setattr(llm, "get_async_openrouter_client", lambda: client)
+
+        result = await llm.acall_llm([{"role": "user", "content": "hi"}])
+
+        assert result == "hello"
+        assert client.chat.completions.create.await_args.kwargs["model"] == llm.DEFAULT_MODEL
+
+    @pytest.mark.asyncio
+    async def test_empty_choices_returns_empty_string(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=_completion(None))
+        monkeypatch.setattr(llm, "get_async_openrouter_client", lambda: client)
+
+        assert await llm.acall_llm([{"role": "user", "content": "hi"}]) == ""
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion("cached")
+        monkeypatch.setattr(llm, "get_openrouter_client", lambda: client)
+        monkeypatch.setattr(llm, "_response_cache", OrderedDict())
+        return client
+
+    def test_deterministic_request_is_cached(self, client: MagicMock) -> None:
+        messages = [{"role": "user", "content": "hi"}]
+        assert llm.call_llm(messages, temperature=0) == "cached"
+        assert llm.call_llm(messages, temperature=0) == "cached"
+        assert client.chat.completions.create.call_count == 1
+
+    def test_sampled_request_is_not_cached(self, client: MagicMock) -> None:
+        messages = [{"role": "user", "content": "hi"}]
+        llm.call_llm(messages, temperature=0.7)
+        llm.call_llm(messages, temperature=0.7)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_different_messages_not_shared(self, client: MagicMock) -> None:
+        llm.call_llm([{"role": "user", "content": "a"}], temperature=0)
+        llm.call_llm([{"role": "user", "content": "b"}], temperature=0)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_empty_response_not_cached(self, client: MagicMock) -> None:
+        client.chat.completions.create.return_value = _completion(None)
+        messages = [{"role": "user", "content": "hi"}]
+        llm.call_llm(messages, temperature=0)
+        llm.call_llm(messages, temperature=0)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_evicts_least_recently_used(
+        self, client: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(llm, "LLM_CACHE_SIZE", 1)
+        llm.call_llm([{"role": "user", "content": "a"}], temperature=0)
+        llm.call_llm([{"role": "user", "content": "b"}], temperature=0)
+        llm.call_llm([{"role": "user", "content": "a"}], temperature=0)
+        assert client.chat.completions.create.call_count == 3
+
+    def test_cache_clear(self, client: MagicMock) -> None:
+        messages = [{"role": "user", "content": "hi"}]
+        llm.call_llm(messages, temperature=0)
+        llm.llm_cache_clear()
+        llm.call_llm(messages, temperature=0)
+        assert client.chat.completions.create.call_count == 2
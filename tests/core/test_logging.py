@@ -0,0 +1,35 @@
+"""Tests for logging helpers."""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from browser_agent.core.logging import logEvent, logForDebugging
+
+
+class _Unformattable:
+    """Value that fails the test if it is ever formatted into a message."""
+
+    def __str__(self) -> str:
+        raise AssertionError("disabled log record was formatted")
+
+
+class TestLevelGating:
+    def test_disabled_debug_message_is_not_formatted(self) -> None:
+        logForDebugging("checking", extra={"value": _Unformattable()})
+
+    def test_enabled_event_is_logged_with_properties(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger="browser_agent"):
+            logEvent("task_done", {"steps": 3})
+        assert '[EVENT] task_done | {"steps":3}' in caplog.text
+
+    def test_debug_message_logged_when_enabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.DEBUG, logger="browser_agent"):
+            logForDebugging("checking", extra={"value": 1})
+        assert 'checking | {"value":1}' in caplog.text
+
+    def test_non_json_values_are_stringified(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger="browser_agent"):
+            logEvent("saved", {"path": Path("/tmp/x")})
+        assert '[EVENT] saved | {"path":"/tmp/x"}' in caplog.text
@@ -0,0 +1,193 @@
+"""Tests for helpers in scripts/eval.py."""
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_agent.core.browser import discard_session_dir
+
+EVAL_SCRIPT = Path(__file__).parent.parent / "scripts" / "eval.py"
+
+
+def _load_eval_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("eval_script", EVAL_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve annotations through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+eval_script = _load_eval_script()
+
+
+@pytest.fixture
+def eval_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(eval_script, "EVAL_SESSION_DIR", tmp_path / "eval-session")
+    monkeypatch.setattr(eval_script, "EVAL_RESULTS_DIR", tmp_path / "eval-results")
+    return tmp_path
+
+
+class TestResultsPath:
+    def test_results_survive_session_discard(self, eval_home: Path) -> None:
+        eval_script.EVAL_SESSION_DIR.mkdir()
+        results_path = eval_script._results_path()
+        results_path.write_text('{"task_name": "t"}\n')
+
+        discard_session_dir(eval_script.EVAL_SESSION_DIR)
+
+        assert results_path.read_text() == '{"task_name": "t"}\n'
+
+    def test_results_outside_session_dir(self, eval_home: Path) -> None:
+        results_path = eval_script._results_path()
+
+        assert results_path.parent == eval_script.EVAL_RESULTS_DIR
+        assert eval_script.EVAL_SESSION_DIR not in results_path.parents
+        assert results_path.suffix == ".jsonl"
+
+
+def _slot(goto: AsyncMock) -> Any:
+    slot = MagicMock()
+    slot.page.goto = goto
+    slot.context.clear_cookies = AsyncMock()
+    slot.context.close = AsyncMock()
+    slot.context.pages = [slot.page]
+    return slot
+
+
+async def _run_one(slot: Any, task_timeout: float = 5.0) -> tuple[Any, asyncio.Queue[Any]]:
+    pool: asyncio.Queue[Any] = asyncio.Queue()
+    pool.put_nowait(slot)
+    task = eval_script.TestTask(name="t", description="do it", expected_steps=1)
+    result = await eval_script._run_one(
+        task, 0, 1, pool, MagicMock(), asyncio.Queue(), task_timeout=task_timeout
+    )
+    return result, pool
+
+
+class TestRunOneSlotReset:
+    @pytest.mark.asyncio
+    async def test_hung_reset_times_out_and_replaces_slot(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def hang(*_: Any) -> None:
+            await asyncio.Event().wait()
+
+        slot = _slot(AsyncMock(side_effect=hang))
+        fresh = _slot(AsyncMock())
+        new_slot = AsyncMock(return_value=fresh)
+        monkeypatch.setattr(eval_script, "_new_slot", new_slot)
+
+        result, pool = await _run_one(slot, task_timeout=0.05)
+
+        assert not result.success
+        assert "Timeout" in result.error_message
+        new_slot.assert_awaited_once_with(slot.context.browser)
+        slot.context.close.assert_awaited_once()
+        assert pool.get_nowait() is fresh
+
+    @pytest.mark.asyncio
+    async def test_failed_reset_keeps_slot_if_replacement_fails(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        slot = _slot(AsyncMock(side_effect=RuntimeError("page crashed")))
+        monkeypatch.setattr(
+            eval_script, "_new_slot", AsyncMock(side_effect=RuntimeError("browser gone"))
+        )
+
+        result, pool = await _run_one(slot)
+
+        assert not result.success
+        assert result.error_message == "page crashed"
+        # The pool must not shrink, or tasks waiting on it would hang
+        assert pool.get_nowait() is slot
+
+
+@pytest.fixture
+def plan_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "plan-cache.json"
+    monkeypatch.setattr(eval_script, "PLAN_CACHE_PATH", path)
+    return path
+
+
+class TestPlanCache:
+    def test_non_dict_file_is_a_miss(self, plan_cache_path: Path) -> None:
+        plan_cache_path.write_text("[]")
+
+        assert eval_script._load_plan_cache() == {}
+
+    def test_malformed_entries_dropped(self, plan_cache_path: Path) -> None:
+        plan_cache_path.write_text(json.dumps({
+            "good": ["step one", "step two"],
+            "not-a-list": "step",
+            "bad-step": ["step", 3],
+        }))
+
+        assert eval_script._load_plan_cache() == {"good": ["step one", "step two"]}
+
+    def test_save_keeps_newest_entries(
+        self, plan_cache_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(eval_script, "PLAN_CACHE_MAX_ENTRIES", 2)
+
+        eval_script._save_plan_cache({"a": ["1"], "b": ["2"], "c": ["3"]})
+
+        assert eval_script._load_plan_cache() == {"b": ["2"], "c": ["3"]}
+
+    def test_key_depends_on_cache_version(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = eval_script._plan_cache_key("task")
+        monkeypatch.setattr(eval_script, "PLAN_CACHE_VERSION", eval_script.PLAN_CACHE_VERSION + 1)
+
+        assert eval_script._plan_cache_key("task") != before
+
+
+def _mock_batch_planner(monkeypatch: pytest.MonkeyPatch, plans: list[tuple[str, list[str]]]) -> AsyncMock:
+    from agents import Runner
+
+    from browser_agent.agents import BatchPlan, TaskPlan
+
+    result = MagicMock()
+    result.final_output_as.return_value = BatchPlan(
+        plans=[TaskPlan(task=task, steps=steps) for task, steps in plans]
+    )
+    run = AsyncMock(return_value=result)
+    monkeypatch.setattr(Runner, "run", run)
+    return run
+
+
+def _tasks(*descriptions: str) -> list[Any]:
+    return [
+        eval_script.TestTask(name=desc, description=desc, expected_steps=1)
+        for desc in descriptions
+    ]
+
+
+class TestBatchPlan:
+    @pytest.mark.asyncio
+    async def test_reordered_plans_matched_by_task(
+        self, plan_cache_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _mock_batch_planner(monkeypatch, [("second", ["b"]), ("first", ["a"])])
+
+        plans = await eval_script._batch_plan(_tasks("first", "second"), MagicMock())
+
+        assert plans == ["first\n\nPlan:\n1. a", "second\n\nPlan:\n1. b"]
+
+    @pytest.mark.asyncio
+    async def test_unmatched_task_falls_back_to_planner(
+        self, plan_cache_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _mock_batch_planner(monkeypatch, [("second", ["b"]), ("something else", ["x"])])
+
+        plans = await eval_script._batch_plan(_tasks("first", "second"), MagicMock())
+
+        assert plans == [None, "second\n\nPlan:\n1. b"]
+        assert list(eval_script._load_plan_cache().values()) == [["b"]]
@@ -0,0 +1,71 @@
+"""Tests for the event-loop bootstrap and shutdown helpers."""
+
+import asyncio
+import os
+import signal
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from browser_agent.runtime import run, wait_for_shutdown
+
+
+class TestRun:
+    def test_returns_coroutine_result(self) -> None:
+        async def answer() -> int:
+            await asyncio.sleep(0)
+            return 42
+
+        assert run(answer()) == 42
+
+
+class TestWaitForShutdown:
+    @pytest.mark.asyncio
+    async def test_returns_when_context_closes(self) -> None:
+        handlers: dict[str, Callable[[Any], None]] = {}
+        context = MagicMock()
+        context.on.side_effect = lambda event, handler: handlers.__setitem__(event, handler)
+
+        waiter = asyncio.create_task(wait_for_shutdown(context))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        handlers["close"](context)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    def test_restores_runner_sigint_handler(self) -> None:
+        async def main() -> tuple[Any, Any]:
+            runner_handler = signal.getsignal(signal.SIGINT)
+            context = _closing_context()
+            await wait_for_shutdown(context)
+            return runner_handler, signal.getsignal(signal.SIGINT)
+
+        with asyncio.Runner() as runner:
+            before, after = runner.run(main())
+
+        # Ctrl+C after the wait must still go through Runner's cancel logic
+        assert before is not signal.default_int_handler
+        assert after is before
+
+    def test_fallback_treats_runner_interrupt_as_shutdown(self) -> None:
+        async def main() -> str:
+            loop = asyncio.get_running_loop()
+            with patch.object(loop, "add_signal_handler", side_effect=NotImplementedError):
+                # asyncio.Runner turns this into cancelling the main task
+                loop.call_later(0.01, os.kill, os.getpid(), signal.SIGINT)
+                await wait_for_shutdown(MagicMock())
+            return "shut down"
+
+        with asyncio.Runner() as runner:
+            assert runner.run(main()) == "shut down"
+
+
+def _closing_context() -> MagicMock:
+    """A fake browser context that fires its close handler right away."""
+    context = MagicMock()
+    context.on.side_effect = lambda event, handler: asyncio.get_running_loop().call_soon(
+        handler, context
+    )
+    return context